@@ -27,6 +27,9 @@ __version__ = "0.1.0"
 __author__ = "Jiawei Ru"
 __description__ = "Simple and convenient audio data analysis and processing toolkit"
 
+import os
+from pathlib import Path
+
 # Initialize logging with sensible defaults
 from .core.logging import setup
 
@@ -39,6 +42,14 @@ from .core.exceptions import (
     ValidationError,
 )
 
+# Cache numba JIT output (used by librosa and model backends) once per machine
+# instead of recompiling in every worker process. Must precede numba's import.
+# The path matches the default `config.cache_dir` without creating the config.
+os.environ.setdefault(
+    "NUMBA_CACHE_DIR", str(Path.home() / ".cream" / "cache" / "numba")
+)
+os.environ.setdefault("NUMBA_THREADING_LAYER", "workqueue")
+
 # Unified processing interfaces
 from .audio.audio_processor import AudioProcessorInterface
 from .text.text_processor import TextProcessorInterface
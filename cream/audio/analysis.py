@@ -4,36 +4,69 @@ import json
 import subprocess
 from pathlib import Path
 
-from cream.core.processor import register_processor, ModelBackedProcessor
-from cream.audio.audio_processor import BaseAudioProcessor
+from cream.core.processor import register_processor, ModelBackedProcessor, as_bool
+from cream.audio.audio_processor import BaseAudioProcessor, load_audio_info
 from cream.core.exceptions import AudioProcessingError
 from cream.core.logging import get_logger
 from cream.core.config import config, set_env
+from cream.core.feature_cache import FeatureCache
+from cream.core.plotting import print_histogram, uplot_histogram
 
-from mutagen import File
+# Optional faster JSON encoder; resolved once since failed imports aren't cached
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = get_logger()
 
 
+def _write_json(data, output_path: Path) -> None:
+    """Write indented, key-sorted JSON, using orjson when it is installed."""
+    if orjson is None:
+        with output_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, sort_keys=True)
+        return
+
+    option = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_SORT_KEYS
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+    )
+    output_path.write_bytes(orjson.dumps(data, option=option))
+
+
 @register_processor("audio_metaviewer")
 class AudioMetaViewer(BaseAudioProcessor):
+    """Show audio metadata, cached on disk across runs.
+
+    Pass `cache_regenerate=true` to ignore cached entries and re-parse files.
+    Batch runs print a length histogram; `external_hist=true` draws it with
+    youplot (`uplot`) instead.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cache = FeatureCache(config.cache_dir / "audio_metaviewer.sqlite")
+
     def process_single(
         self, input_path: Path, output_path: Path | None = None, **kwargs
     ) -> dict[str, int | float]:
         self.validate_input(input_path)
 
-        audio = File(input_path)
-        if audio is None:
+        if not as_bool(kwargs.get("cache_regenerate", False)):
+            info = self.cache.get(input_path)
+            if info is not None:
+                return info
+
+        info = load_audio_info(input_path)
+        if info is None:
             logger.error(f"Failed to load file: {input_path}")
             raise AudioProcessingError
 
-        return {
-            "channels": getattr(audio.info, "channels", None),
-            "length": getattr(audio.info, "length", None),
-            "sample_rate": getattr(audio.info, "sample_rate", None),
-            "bits_per_sample": getattr(audio.info, "bits_per_sample", None),
-            "bitrate": getattr(audio.info, "bitrate", None),
-        }
+        self.cache.set(input_path, info)
+        return info
 
     def process_batch(
         self,
@@ -46,15 +79,14 @@ class AudioMetaViewer(BaseAudioProcessor):
             input_files, output_dir, num_workers, **kwargs
         )
 
-        # Print length distribution with youplot
-        lengths = [r["length"] for r in process_results]
+        # Print length distribution, with youplot only when requested
+        lengths = [r["length"] for r in process_results if r["length"] is not None]
+        if not as_bool(kwargs.get("external_hist", False)):
+            print_histogram(lengths, title="Audio length (s)")
+            return process_results
+
         try:
-            subprocess.run(
-                ["uplot", "hist"],
-                input="\n".join(map(str, lengths)),
-                text=True,
-                check=True,
-            )
+            uplot_histogram(lengths)
         except subprocess.CalledProcessError as e:
             error_message = f"Command failed: {e}\nstdout: {e.stdout or ''}\nstderr: {e.stderr or ''}"
             logger.error(error_message)
@@ -69,6 +101,10 @@ class VAD_FSMN(ModelBackedProcessor):
     learn more: https://github.com/modelscope/FunASR
     """
 
+    # FunASR's AutoModel.generate isn't known to be reentrant, so don't share
+    # one instance across threads
+    PARALLEL_KIND = "process"
+
     def load_model(self):
         try:
             from funasr import AutoModel
@@ -87,7 +123,6 @@ class VAD_FSMN(ModelBackedProcessor):
         output_path = output_path or input_path.with_suffix(".json")
 
         result = self.model.generate(input=input_path)
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent=2, sort_keys=True)
+        _write_json(result, output_path)
 
         return output_path
@@ -1,5 +1,6 @@
 """Unified audio processor interface."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from cream.core.processor import BaseProcessor, processor_registry
@@ -10,13 +11,47 @@ from cream.core.config import config
 logger = get_logger()
 
 
+@lru_cache(maxsize=4096)
+def _read_audio_info(
+    path: str, mtime_ns: int, size: int
+) -> dict[str, int | float | None] | None:
+    """Parse container metadata with mutagen; keyed by stat so edits invalidate."""
+    from mutagen import File
+
+    audio = File(path)
+    if audio is None:
+        return None
+
+    return {
+        "channels": getattr(audio.info, "channels", None),
+        "length": getattr(audio.info, "length", None),
+        "sample_rate": getattr(audio.info, "sample_rate", None),
+        "bits_per_sample": getattr(audio.info, "bits_per_sample", None),
+        "bitrate": getattr(audio.info, "bitrate", None),
+    }
+
+
+def load_audio_info(input_path: Path) -> dict[str, int | float | None] | None:
+    """Get audio metadata, reusing earlier parses of an unchanged file.
+
+    Args:
+        input_path: Path to the audio file.
+
+    Returns:
+        Dict of stream info, or None if mutagen can't read the file.
+    """
+    stat = input_path.stat()
+    info = _read_audio_info(str(input_path), stat.st_mtime_ns, stat.st_size)
+    return dict(info) if info is not None else None
+
+
 class BaseAudioProcessor(BaseProcessor):
     """Base class for audio processors."""
 
     @property
-    def SUPPORTED_FORMATS(self):
+    def SUPPORTED_FORMATS(self) -> frozenset[str]:
         """Get supported audio formats from config."""
-        return set(config.audio_formats)
+        return config.audio_format_set
 
     def validate_input(self, input_path: Path) -> None:
         """Validate audio input file."""
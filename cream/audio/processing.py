@@ -1,21 +1,56 @@
 """Audio processing templates - separation, enhancement, and basic processing."""
 
 import subprocess
+from functools import partial
 from pathlib import Path
-
-import librosa
-import soundfile as sf
+from typing import TYPE_CHECKING
 
 from cream.core.processor import register_processor, ModelBackedProcessor
-from cream.audio.audio_processor import BaseAudioProcessor
+from cream.audio.audio_processor import BaseAudioProcessor, load_audio_info
 from cream.core.exceptions import AudioProcessingError
 from cream.core.logging import get_logger
 from cream.core.config import config
+from cream.core.parallel import ParallelProcessor
 
-from mutagen import File
+# Audio I/O libraries are imported where used to keep `import cream` light
+if TYPE_CHECKING:
+    import soundfile as sf
 
 logger = get_logger()
 
+# Frames per write block when streaming audio to disk
+_BLOCK_FRAMES = 1 << 16
+
+# Inputs larger than this are resampled as a stream instead of in memory
+_STREAM_MIN_BYTES = 100 * 1024 * 1024
+
+# Files per ffmpeg-normalize invocation in batch mode
+_NORMALIZE_CHUNK_SIZE = 32
+
+
+def _open_writer(output_path: Path, samplerate: int, channels: int) -> "sf.SoundFile":
+    """Open an output file, writing PCM_16 directly when the format allows it."""
+    import soundfile as sf
+
+    fmt = output_path.suffix[1:].upper()
+    subtype = "PCM_16" if sf.check_format(fmt, "PCM_16") else None
+    return sf.SoundFile(
+        str(output_path), "w", samplerate=samplerate, channels=channels, subtype=subtype
+    )
+
+
+def _partial_path(output_path: Path) -> Path:
+    """Hidden path beside output_path to write to before swapping it in."""
+    return output_path.with_name(f".{output_path.stem}.partial{output_path.suffix}")
+
+
+def _file_size(path: Path) -> int:
+    """Size in bytes for ordering; missing files are reported by validation."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
 
 @register_processor("audio_resampler")
 class AudioResampler(BaseAudioProcessor):
@@ -31,11 +66,70 @@ class AudioResampler(BaseAudioProcessor):
             )
         target_sr = int(kwargs.get("target_sr", 22050))
 
-        y, sr = librosa.load(input_path, sr=target_sr)
+        import soundfile as sf
+        import soxr
+
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        sf.write(output_path, y, sr)
+
+        # Stream long inputs block by block so memory stays bounded
+        if input_path.stat().st_size > _STREAM_MIN_BYTES:
+            try:
+                src = sf.SoundFile(input_path)
+            except sf.LibsndfileError:
+                pass  # Not readable by libsndfile; decoded in memory below
+            else:
+                with src:
+                    self._resample_stream(src, output_path, target_sr)
+                return output_path
+
+        # Decode at the native rate and resample with soxr directly, skipping
+        # librosa's wrapper. Multi-channel input is downmixed like librosa's
+        # default `mono=True`.
+        try:
+            y, sr = sf.read(input_path, dtype="float32")
+        except sf.LibsndfileError:
+            # libsndfile can't decode some formats (e.g. m4a, wma); librosa
+            # falls back to audioread for those
+            import librosa
+
+            y, sr = librosa.load(input_path, sr=None)
+        if y.ndim > 1:
+            y = y.mean(axis=1)
+        if sr != target_sr:
+            y = soxr.resample(y, sr, target_sr, quality="HQ")
+
+        # Stream views of the buffer to libsndfile block by block instead of
+        # handing it a whole-file copy to convert at once.
+        with _open_writer(output_path, target_sr, channels=1) as f:
+            for i in range(0, y.shape[0], _BLOCK_FRAMES):
+                f.write(y[i : i + _BLOCK_FRAMES])
         return output_path
 
+    @staticmethod
+    def _resample_stream(src: "sf.SoundFile", output_path: Path, target_sr: int):
+        """Decode, downmix, resample and encode one block at a time."""
+        import numpy as np
+        import soxr
+
+        # Write beside the target and swap it in at the end, since the input
+        # may be the file being overwritten.
+        partial_path = _partial_path(output_path)
+        resampler = soxr.ResampleStream(
+            src.samplerate, target_sr, 1, dtype="float32", quality="HQ"
+        )
+        try:
+            with _open_writer(partial_path, target_sr, channels=1) as dst:
+                for block in src.blocks(_BLOCK_FRAMES, dtype="float32", always_2d=True):
+                    dst.write(resampler.resample_chunk(block.mean(axis=1)))
+                dst.write(
+                    resampler.resample_chunk(np.empty(0, dtype=np.float32), last=True)
+                )
+        except BaseException:
+            # Don't leave a half-written file for the next directory scan
+            partial_path.unlink(missing_ok=True)
+            raise
+        partial_path.replace(output_path)
+
 
 @register_processor("audio_normalizer")
 class AudioNormalizer(BaseAudioProcessor):
@@ -43,32 +137,158 @@ class AudioNormalizer(BaseAudioProcessor):
     learn more: https://github.com/slhck/ffmpeg-normalize
     """
 
+    # Workers only wait on ffmpeg-normalize subprocesses
+    PARALLEL_KIND = "thread"
+
     def process_single(
         self, input_path: Path, output_path: Path | None = None, **kwargs
     ) -> Path:
         self.validate_input(input_path)
         output_path = output_path or input_path
+        sample_rate = self._output_sample_rate(input_path, kwargs)
+
+        self._run([(input_path, output_path)], sample_rate, kwargs)
+        return output_path
+
+    def process_batch(
+        self,
+        input_files: list[Path],
+        output_dir: Path | None = None,
+        num_workers: int | None = None,
+        **kwargs,
+    ):
+        """Normalize files in chunks, one ffmpeg-normalize call per chunk."""
+        # Smaller chunks when there are few files, so every worker gets some
+        num_workers = num_workers or config.max_workers
+        chunk_size = max(
+            1, min(_NORMALIZE_CHUNK_SIZE, -(-len(input_files) // num_workers))
+        )
+        chunks = [
+            input_files[i : i + chunk_size]
+            for i in range(0, len(input_files), chunk_size)
+        ]
+
+        processor = ParallelProcessor(
+            num_workers, use_threads=self.PARALLEL_KIND == "thread"
+        )
+        description = f"Processing with {self.__class__.__name__}"
+        chunk_results = processor.process_batch(
+            chunks,
+            partial(self.normalize_chunk, output_dir=output_dir, kwargs=kwargs),
+            description,
+        )
+        return [path for chunk in chunk_results for path in chunk]
+
+    def normalize_chunk(
+        self, input_files: list[Path], output_dir: Path | None, kwargs: dict
+    ) -> list[Path]:
+        """Validate and normalize a chunk of files, one call per sample rate."""
+        # Options apply to every file of a call, so group by output sample rate.
+        # Validation and probing run here, in the workers, not up front.
+        groups: dict[int | str | None, list[tuple[Path, Path]]] = {}
+        output_paths = []
+        for input_path in input_files:
+            self.validate_input(input_path)
+            output_path = (
+                output_dir / input_path.name if output_dir is not None else input_path
+            )
+            sample_rate = self._output_sample_rate(input_path, kwargs)
+            groups.setdefault(sample_rate, []).append((input_path, output_path))
+            output_paths.append(output_path)
+
+        for sample_rate, pairs in groups.items():
+            self._normalize_group(pairs, sample_rate, kwargs)
+        return output_paths
+
+    def _normalize_group(
+        self,
+        pairs: list[tuple[Path, Path]],
+        sample_rate: int | str | None,
+        kwargs: dict,
+    ) -> None:
+        """Normalize pairs in one call, retrying one by one if it fails."""
+        if len(pairs) > 1:
+            # Write beside each target and swap all in only once the call
+            # succeeds, so a failed call leaves inputs untouched for the retry
+            # and no file is normalized twice.
+            partial_paths = [_partial_path(output_path) for _, output_path in pairs]
+            partial_pairs = [
+                (input_path, partial_path)
+                for (input_path, _), partial_path in zip(pairs, partial_paths)
+            ]
+            try:
+                subprocess.run(
+                    self._build_command(partial_pairs, sample_rate, kwargs),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    check=True,
+                )
+            except BaseException as e:
+                for partial_path in partial_paths:
+                    partial_path.unlink(missing_ok=True)
+                if not isinstance(e, subprocess.CalledProcessError):
+                    raise
+                logger.warning(f"Batch normalization failed, retrying per file: {e}")
+            else:
+                for (_, output_path), partial_path in zip(pairs, partial_paths):
+                    partial_path.replace(output_path)
+                return
+
+        for pair in pairs:
+            self._run([pair], sample_rate, kwargs)
+
+    @staticmethod
+    def _output_sample_rate(input_path: Path, kwargs: dict) -> int | str | None:
+        sample_rate = kwargs.get("sample_rate")
+        # Only EBU normalization resamples (to 192 kHz), so only then probe the
+        # input rate to keep it; peak/RMS output already keeps the source rate.
+        if sample_rate is None and kwargs.get("normalization_type") in (None, "ebu"):
+            sample_rate = (load_audio_info(input_path) or {}).get("sample_rate")
+        return sample_rate
+
+    @staticmethod
+    def _build_command(
+        pairs: list[tuple[Path, Path]], sample_rate: int | str | None, kwargs: dict
+    ) -> list[str]:
         normalization_type = kwargs.get("normalization_type")
         target_level = kwargs.get("target_level")
-        sample_rate = getattr(File(input_path).info, "sample_rate", None)
 
         # ffmpeg-normalize uses EBU loudness normalization by default
         # with a target level of -23 LUFS.
-        cmd = ["ffmpeg-normalize", str(input_path), "-o", str(output_path), "-f"]
+        cmd = [
+            "ffmpeg-normalize",
+            *(str(input_path) for input_path, _ in pairs),
+            "-o",
+            *(str(output_path) for _, output_path in pairs),
+            "-f",
+        ]
         if normalization_type is not None:
             cmd += ["-nt", normalization_type]
         if target_level is not None:
             cmd += ["-t", target_level]
         if sample_rate is not None:
             cmd += ["-ar", str(sample_rate)]
-
+        return cmd
+
+    def _run(
+        self,
+        pairs: list[tuple[Path, Path]],
+        sample_rate: int | str | None,
+        kwargs: dict,
+    ) -> None:
         try:
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Discard stdout and keep stderr as raw bytes, decoding it only on failure
+            subprocess.run(
+                self._build_command(pairs, sample_rate, kwargs),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True,
+            )
         except subprocess.CalledProcessError as e:
-            error_message = f"Command failed: {e}\nstdout: {e.stdout or ''}\nstderr: {e.stderr or ''}"
+            stderr = e.stderr.decode(errors="replace") if e.stderr else ""
+            error_message = f"Command failed: {e}\nstderr: {stderr}"
             logger.error(error_message)
             raise AudioProcessingError(error_message) from e
-        return output_path
 
 
 class ClearVoiceProcessor(ModelBackedProcessor, BaseAudioProcessor):
@@ -76,6 +296,10 @@ class ClearVoiceProcessor(ModelBackedProcessor, BaseAudioProcessor):
     learn more: https://github.com/modelscope/ClearerVoice-Studio
     """
 
+    # ClearVoice keeps per-call state (input path, decoded audio info) on the
+    # model, so concurrent calls on one instance race; give each worker its own
+    PARALLEL_KIND = "process"
+
     def patch_checkpoint_dir(self, cache_root: Path):
         try:
             from clearvoice import network_wrapper
@@ -107,7 +331,7 @@ class ClearVoiceProcessor(ModelBackedProcessor, BaseAudioProcessor):
             raise AudioProcessingError from e
 
         self.patch_checkpoint_dir(cache_root=config.model_dir / "ClearVoice")
-        model = ClearVoice(task=self.task, model_names=[self.model])
+        model = ClearVoice(task=self.task, model_names=[self.model_name])
 
         return model
 
@@ -121,24 +345,50 @@ class ClearVoiceProcessor(ModelBackedProcessor, BaseAudioProcessor):
 
         return output_path
 
+    def process_batch(
+        self,
+        input_files: list[Path],
+        output_dir: Path | None = None,
+        num_workers: int | None = None,
+        **kwargs,
+    ):
+        """Process files longest first, each worker on its own model copy.
+
+        Files are not padded and stacked into one forward pass: ClearVoice
+        scales each input by its own level, so padding would change outputs.
+        Going longest first lets each worker's CUDA caching allocator reserve
+        the largest buffers once and reuse them for the shorter files that
+        follow. Results are returned in input order.
+        """
+        sizes = [_file_size(input_path) for input_path in input_files]
+        order = sorted(range(len(input_files)), key=sizes.__getitem__, reverse=True)
+        results = super().process_batch(
+            [input_files[i] for i in order], output_dir, num_workers, **kwargs
+        )
+
+        ordered_results = [None] * len(results)
+        for i, result in zip(order, results):
+            ordered_results[i] = result
+        return ordered_results
+
 
 # Add more ClearVoice models here~
-# Required supported `task` and `model`
+# Required supported `task` and `model_name`
 
 
 @register_processor("audio_denoiser_mossformergan_16k")
 class AudioDenoiserMossFormerGANSR16k(ClearVoiceProcessor):
     task = "speech_enhancement"
-    model = "MossFormerGAN_SE_16K"
+    model_name = "MossFormerGAN_SE_16K"
 
 
 @register_processor("audio_denoiser_mossformer2_48k")
 class AudioDenoiserMossFormer2SR48k(ClearVoiceProcessor):
     task = "speech_enhancement"
-    model = "MossFormer2_SE_48K"
+    model_name = "MossFormer2_SE_48K"
 
 
 @register_processor("audio_separator_mossformer2_16k")
 class AudioSeparatorMossFormer2SR16k(ClearVoiceProcessor):
     task = "speech_separation"
-    model = "MossFormer2_SS_16K"
+    model_name = "MossFormer2_SS_16K"
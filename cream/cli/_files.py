@@ -0,0 +1,44 @@
+"""Directory scanning shared by the CLI batch commands."""
+
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from cream.core.logging import get_logger
+
+logger = get_logger()
+
+
+def iter_files(root: Path, suffixes: Iterable[str]) -> Iterator[Path]:
+    """Recursively yield files under root whose lowercase suffix matches.
+
+    Uses `os.scandir` so entry types come from the directory listing rather
+    than a stat per entry. Symlinked files are included and symlinked
+    directories are not descended into, and directories that can't be
+    listed are skipped with a warning, as with `Path.rglob`.
+
+    Args:
+        root: Directory to scan.
+        suffixes: Accepted suffixes including the dot (e.g. ".wav").
+
+    Yields:
+        Paths of matching files.
+    """
+    suffixes = frozenset(suffixes)
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            logger.warning(f"Skipping unreadable directory {directory}: {e}")
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (
+                    os.path.splitext(entry.name)[1].lower() in suffixes
+                    and entry.is_file()
+                ):
+                    yield Path(entry.path)
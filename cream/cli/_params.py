@@ -0,0 +1,19 @@
+"""Parsing of repeatable `--param key=value` CLI options."""
+
+import typer
+
+
+def parse_params(param_entries: list[str]) -> dict[str, str]:
+    """Parse key=value CLI parameters into a dictionary."""
+    params: dict[str, str] = {}
+    for entry in param_entries:
+        key, sep, value = entry.partition("=")
+        if not sep:
+            raise typer.BadParameter(
+                "Use --param key=value to pass processor arguments"
+            )
+        key = key.strip()
+        if not key:
+            raise typer.BadParameter("Parameter key cannot be empty")
+        params[key] = value.strip()
+    return params
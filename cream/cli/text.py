@@ -16,27 +16,13 @@ from cream.text.text_processor import TextProcessorInterface, BaseTextProcessor
 from cream.core.config import config
 from cream.core.processor import processor_registry
 from cream.core.exceptions import CreamError
+from cream.cli._files import iter_files
+from cream.cli._params import parse_params
 
 console = Console()
 app = typer.Typer(help="Text processing commands")
 
 
-def _parse_params(param_entries: list[str]) -> dict[str, str]:
-    """Parse key=value CLI parameters into a dictionary."""
-    params: dict[str, str] = {}
-    for entry in param_entries:
-        if "=" not in entry:
-            raise typer.BadParameter(
-                "Use --param key=value to pass processor arguments"
-            )
-        key, value = entry.split("=", 1)
-        key = key.strip()
-        if not key:
-            raise typer.BadParameter("Parameter key cannot be empty")
-        params[key] = value.strip()
-    return params
-
-
 @app.command("process")
 def process_text(
     input_path: Annotated[Path, typer.Argument(..., help="Input file or directory")],
@@ -56,15 +42,11 @@ def process_text(
     console.print(f"[green]Processing text using {method}[/green]")
 
     try:
-        extra_args = _parse_params(params)
+        extra_args = parse_params(params)
         interface = TextProcessorInterface(method=method)
 
         if input_path.is_dir():
-            files = [
-                p
-                for p in input_path.rglob("*")
-                if p.is_file() and config.is_text_file(p)
-            ]
+            files = list(iter_files(input_path, config.text_format_set))
             if not files:
                 console.print(
                     f"[yellow]No supported text files under {input_path}[/yellow]"
@@ -5,7 +5,7 @@ including configuration management, processors, parallel processing,
 and exception handling.
 """
 
-from .config import config
+from .config import config, get_config
 from .exceptions import (
     AudioProcessingError,
     CreamError,
@@ -16,6 +16,7 @@ from .processor import BaseProcessor, ModelBackedProcessor, processor_registry
 
 __all__ = [
     "config",
+    "get_config",
     "CreamError",
     "AudioProcessingError",
     "TextProcessingError",
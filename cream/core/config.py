@@ -2,7 +2,8 @@
 
 This module provides centralized configuration management for the cream package,
 including supported file formats, model configurations, and processing defaults.
-The global `config` instance can be imported and used throughout the package.
+The global `config` instance can be imported and used throughout the package; it
+is created (and its directories touched) on first attribute access, not on import.
 
 Example:
     Basic usage of the configuration manager:
@@ -13,40 +14,51 @@ Example:
 
 Classes:
     CreamConfig: Global configuration manager with file format checking and model configs.
+
+Functions:
+    get_config: Return the global CreamConfig instance, creating it on first call.
 """
 
 import os
 from pathlib import Path
 from dataclasses import dataclass, field
 from contextlib import contextmanager
+from functools import cache, lru_cache
 
 from .logging import get_logger
 
 logger = get_logger()
 
 
+@lru_cache(maxsize=32)
+def _stringify_environ(items: tuple) -> dict[str, str]:
+    """Stringify environment values once per distinct set of overrides."""
+    return {k: str(v) if isinstance(v, (Path, int, float)) else v for k, v in items}
+
+
 @contextmanager
 def set_env(**environ):
     old_values = {}
     to_delete = []
 
-    environ_str = {
-        k: str(v) if isinstance(v, (Path, int, float)) else v
-        for k, v in environ.items()
-    }
+    environ_str = _stringify_environ(tuple(sorted(environ.items())))
 
+    # Only touch os.environ (and the process environment) for changed values
     for k, v in environ_str.items():
-        if k in os.environ:
-            old_values[k] = os.environ[k]
-        else:
+        current = os.environ.get(k)
+        if current is None:
             to_delete.append(k)
-        os.environ[k] = v
+        else:
+            old_values[k] = current
+        if current != v:
+            os.environ[k] = v
 
     try:
         yield
     finally:
         for k, v in old_values.items():
-            os.environ[k] = v
+            if os.environ.get(k) != v:
+                os.environ[k] = v
         for k in to_delete:
             os.environ.pop(k, None)
 
@@ -63,6 +75,7 @@ class CreamConfig:
     home_dir: Path = field(default_factory=Path.home)
     config_dir: Path = field(init=False)
     model_dir: Path = field(init=False)
+    cache_dir: Path = field(init=False)
 
     # File format settings
     audio_formats: list[str] = field(
@@ -82,6 +95,10 @@ class CreamConfig:
         default_factory=lambda: [".txt", ".csv", ".tsv", ".json"]
     )
 
+    # Frozen copies of the format lists for O(1) suffix lookups
+    audio_format_set: frozenset[str] = field(init=False, repr=False)
+    text_format_set: frozenset[str] = field(init=False, repr=False)
+
     # Processing settings
     max_workers: int = 1
     enable_progress_bars: bool = True
@@ -94,7 +111,11 @@ class CreamConfig:
         """Initialize derived paths and validate configuration after initialization."""
         self.config_dir = self.home_dir / ".cream"
         self.model_dir = self.config_dir / "models"
-        self.model_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = self.config_dir / "cache"
+        # Stat first: a single syscall when the directory already exists
+        if not self.model_dir.is_dir():
+            self.model_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh_format_caches()
         self.validate_config()
 
     def validate_config(self) -> None:
@@ -108,10 +129,16 @@ class CreamConfig:
         if self.log_file and not Path(self.log_file).parent.exists():
             logger.warning(f"Log file parent directory does not exist: {self.log_file}")
 
+    def refresh_format_caches(self) -> None:
+        """Rebuild the suffix lookup sets after the format lists change."""
+        self.audio_format_set = frozenset(self.audio_formats)
+        self.text_format_set = frozenset(self.text_formats)
+
     def validate_directories(self) -> None:
         """Validate and ensure required directories exist."""
         try:
-            self.model_dir.mkdir(parents=True, exist_ok=True)
+            if not self.model_dir.is_dir():
+                self.model_dir.mkdir(parents=True, exist_ok=True)
             logger.debug(f"Ensured model directory exists: {self.model_dir}")
         except Exception as e:
             logger.error(f"Failed to create model directory: {e}")
@@ -125,7 +152,7 @@ class CreamConfig:
         Returns:
             True if the file extension is in the supported audio formats list.
         """
-        return path.suffix.lower() in self.audio_formats
+        return path.suffix.lower() in self.audio_format_set
 
     def is_text_file(self, path: Path) -> bool:
         """Check if a file has a supported text format extension.
@@ -136,7 +163,7 @@ class CreamConfig:
         Returns:
             True if the file extension is in the supported text formats list.
         """
-        return path.suffix.lower() in self.text_formats
+        return path.suffix.lower() in self.text_format_set
 
     def set_parallel_config(
         self, num_workers: int | None = None, enable_progress_bars: bool | None = None
@@ -164,6 +191,8 @@ class CreamConfig:
         for key, value in kwargs.items():
             if hasattr(self, key) and value is not None:
                 setattr(self, key, value)
+                if key in ("audio_formats", "text_formats"):
+                    self.refresh_format_caches()
                 logger.debug(f"Updated config: {key}={value}")
 
     @property
@@ -182,5 +211,27 @@ class CreamConfig:
         return self.audio_formats + self.text_formats
 
 
-# Global configuration instance
-config = CreamConfig()
+@cache
+def get_config() -> CreamConfig:
+    """Return the global configuration instance, creating it on first call."""
+    return CreamConfig()
+
+
+class _ConfigProxy:
+    """Forward attribute access to the global config, creating it on first use."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        return getattr(get_config(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(get_config(), name, value)
+
+    def __repr__(self) -> str:
+        return repr(get_config())
+
+
+# Global configuration instance, created lazily so importing cream stays free
+# of filesystem side effects
+config: CreamConfig = _ConfigProxy()  # type: ignore[assignment]
@@ -0,0 +1,84 @@
+"""Persistent on-disk cache for per-file analysis results.
+
+Entries are keyed by absolute file path and validated against the file's
+mtime and size, so results for a changed file are recomputed on next access.
+Values must be JSON serializable.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from cream.core.logging import get_logger
+
+logger = get_logger()
+
+
+class FeatureCache:
+    """SQLite-backed cache mapping files to previously computed results."""
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize the cache; the database is opened on first use.
+
+        Args:
+            db_path: Path of the SQLite database file.
+        """
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Connections can't be pickled; worker processes reopen their own
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        return state
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            # WAL lets parallel workers read while another one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS features "
+                "(key TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, blob BLOB)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, path: Path) -> Any | None:
+        """Return the cached result for an unchanged file, or None on a miss."""
+        stat = path.stat()
+        try:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT mtime, size, blob FROM features WHERE key = ?",
+                    (str(path.resolve()),),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Feature cache read failed ({self.db_path}): {e}")
+            return None
+
+        if row is None or row[0] != stat.st_mtime_ns or row[1] != stat.st_size:
+            return None
+        return json.loads(row[2])
+
+    def set(self, path: Path, value: Any) -> None:
+        """Store a result for the current version of a file."""
+        stat = path.stat()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO features VALUES (?, ?, ?, ?)",
+                    (
+                        str(path.resolve()),
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        json.dumps(value),
+                    ),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Feature cache write failed ({self.db_path}): {e}")
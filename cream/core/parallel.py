@@ -1,6 +1,7 @@
 """Simple parallel processing with automatic task distribution."""
 
-import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from cream.core.logging import get_logger
 from cream.core.progress import (
@@ -11,12 +12,31 @@ from cream.core.progress import (
 
 logger = get_logger()
 
+# Leave one core for the main process, which collects results and draws progress
+DATA_CPUS = max(1, (os.cpu_count() or 1) - 1)
+
 
 class ParallelProcessor:
-    """Simple parallel processor with automatic task distribution."""
+    """Simple parallel processor with automatic task distribution.
+
+    CPU-bound tasks run in worker processes to escape the GIL. Tasks that
+    cannot be pickled (e.g. ones holding a loaded model) should use threads.
+    State shared by all tasks can be handed to each worker once through
+    `initializer(*initargs)` instead of being pickled into every task. The
+    sequential path runs no workers and so never calls the initializer.
+    """
 
-    def __init__(self, num_workers: int = 1):
+    def __init__(
+        self,
+        num_workers: int = 1,
+        use_threads: bool = False,
+        initializer=None,
+        initargs: tuple = (),
+    ):
         self.num_workers = num_workers
+        self.use_threads = use_threads
+        self.initializer = initializer
+        self.initargs = initargs
 
     def process_batch(
         self, tasks: list, worker_func, description: str = "Processing"
@@ -37,15 +57,29 @@ class ParallelProcessor:
             log_progress_complete(description, len(tasks))
             return results
 
-        # Multiple workers use multiprocessing Pool with real-time progress
+        if self.use_threads:
+            executor_cls = ThreadPoolExecutor
+            max_workers = min(self.num_workers, len(tasks))
+        else:
+            executor_cls = ProcessPoolExecutor
+            max_workers = min(self.num_workers, DATA_CPUS, len(tasks))
+        logger.debug(f"Using {executor_cls.__name__} with {max_workers} workers")
+
+        # Hand tasks out in chunks to amortize IPC, while keeping several
+        # chunks per worker so the load stays balanced
+        chunksize = max(1, len(tasks) // (max_workers * 4))
+
         log_progress_start(description, len(tasks))
-        with mp.Pool(self.num_workers) as pool:
+        with executor_cls(
+            max_workers=max_workers,
+            initializer=self.initializer,
+            initargs=self.initargs,
+        ) as executor:
             with create_progress() as progress:
                 task_progress = progress.add_task(description, total=len(tasks))
 
-                # Use pool.imap_unordered for real-time progress tracking
                 results = []
-                for result in pool.imap_unordered(worker_func, tasks):
+                for result in executor.map(worker_func, tasks, chunksize=chunksize):
                     results.append(result)
                     progress.update(task_progress, advance=1)
 
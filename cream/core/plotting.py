@@ -0,0 +1,57 @@
+"""Terminal histograms for batch analysis results."""
+
+import subprocess
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+from cream.core.logging import get_logger
+
+logger = get_logger()
+
+# Width in characters of the longest histogram bar
+_BAR_WIDTH = 40
+
+
+def print_histogram(values, bins: int | str = 20, title: str = "Distribution"):
+    """Print a histogram of values as a bar chart on stderr.
+
+    Args:
+        values: Sequence or array of numbers.
+        bins: Number of bins or a numpy binning strategy (e.g. "auto").
+        title: Title shown above the chart.
+    """
+    import numpy as np
+
+    data = np.asarray(values, dtype=np.float32)
+    if data.size == 0:
+        logger.warning("No values to plot")
+        return
+
+    counts, edges = np.histogram(data, bins=bins)
+    peak = counts.max()
+
+    table = Table(title=title, box=None)
+    table.add_column("Range", justify="right")
+    table.add_column("")
+    table.add_column("Count", justify="right")
+    for count, low, high in zip(counts, edges[:-1], edges[1:]):
+        bar = "▇" * round(count / peak * _BAR_WIDTH)
+        table.add_row(f"[{low:.4g}, {high:.4g})", f"[cyan]{bar}", str(count))
+
+    Console(file=sys.stderr).print(table)
+
+
+def uplot_histogram(values) -> None:
+    """Plot a histogram with the external `uplot` (YouPlot) command.
+
+    Raises:
+        subprocess.CalledProcessError: If `uplot` exits with an error.
+    """
+    subprocess.run(
+        ["uplot", "hist"],
+        input="\n".join(map(str, values)),
+        text=True,
+        check=True,
+    )
@@ -5,7 +5,9 @@ tasks. It separates the processing logic from specific implementation methods,
 making it easy to add new algorithms and models.
 """
 
+import threading
 from abc import ABC, abstractmethod
+from functools import partial
 from pathlib import Path
 
 from cream.core.config import config
@@ -16,11 +18,37 @@ from cream.core.parallel import ParallelProcessor
 logger = get_logger()
 
 
-def _process_single_task(args):
-    """Top-level helper so multiprocessing can pickle task execution."""
-    processor, input_path, output_dir, extra_kwargs = args
+def as_bool(value: object) -> bool:
+    """Interpret a processor parameter, possibly a CLI string, as a boolean."""
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+# Processor, output directory and kwargs shared by every task of the batch
+# running in this worker process, set once by `_init_worker`
+_worker_batch: tuple = ()
+
+
+def _init_worker(
+    processor: "BaseProcessor", output_dir: Path | None, kwargs: dict
+) -> None:
+    """Process pool initializer, so batch-wide state is pickled once per worker."""
+    global _worker_batch
+    _worker_batch = (processor, output_dir, kwargs)
+
+
+def _run_task(
+    processor: "BaseProcessor", output_dir: Path | None, kwargs: dict, input_path: Path
+):
+    """Process one input file of a batch."""
     output_path = output_dir / input_path.name if output_dir is not None else None
-    return processor.process_single(input_path, output_path, **extra_kwargs)
+    return processor.process_single(input_path, output_path, **kwargs)
+
+
+def _process_single_task(input_path: Path):
+    """Top-level helper so multiprocessing can pickle task execution."""
+    return _run_task(*_worker_batch, input_path)
 
 
 class BaseProcessor(ABC):
@@ -31,6 +59,11 @@ class BaseProcessor(ABC):
     and processing algorithms in a consistent way.
     """
 
+    # How batches run in parallel: "process" for CPU-bound work in worker
+    # processes, "thread" for work that waits on I/O, subprocesses or a
+    # shared model and would only pay fork and pickle costs.
+    PARALLEL_KIND = "process"
+
     def __init__(self) -> None:
         """Initialize the processor (no stored configuration or logger)."""
         pass
@@ -88,26 +121,62 @@ class BaseProcessor(ABC):
             List of processing results.
         """
 
-        tasks = [
-            (self, input_file, output_dir, dict(kwargs)) for input_file in input_files
-        ]
-
-        processor = ParallelProcessor(num_workers or config.max_workers)
+        num_workers = num_workers or config.max_workers
+        use_threads = self.PARALLEL_KIND == "thread"
+        if use_threads or num_workers == 1:
+            # Tasks run in this process, so bind the batch state to the task
+            # function; a module global would be shared with concurrent batches.
+            processor = ParallelProcessor(num_workers, use_threads=use_threads)
+            worker_func = partial(_run_task, self, output_dir, kwargs)
+        else:
+            processor = ParallelProcessor(
+                num_workers,
+                initializer=_init_worker,
+                initargs=(self, output_dir, kwargs),
+            )
+            worker_func = _process_single_task
         description = f"Processing with {self.__class__.__name__}"
 
-        return processor.process_batch(tasks, _process_single_task, description)
+        return processor.process_batch(input_files, worker_func, description)
 
 
 class ModelBackedProcessor(BaseProcessor):
     """Base class for processors that manage a loaded model.
 
-    Loads the model on construction. No global cache is maintained.
+    Loads the model on first access of `model`, so creating or listing
+    processors stays cheap. No global cache is maintained.
     """
 
+    # Batches share one model across threads by default. Subclasses whose
+    # model keeps per-call state must use "process": the model isn't pickled,
+    # so each worker process loads its own copy on first use.
+    PARALLEL_KIND = "thread"
+
     def __init__(self) -> None:
         super().__init__()
-        # Load the model during initialization
-        self.model = self.load_model()
+        self._model = None
+        # Batches share one instance across threads; load the model only once
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self):
+        """The loaded model, loaded on first use."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = self.load_model()
+        return self._model
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_model_lock"]
+        # Models generally can't be pickled; workers load their own
+        state["_model"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._model_lock = threading.Lock()
 
     @abstractmethod
     def load_model(self):
@@ -120,6 +189,8 @@ class ProcessorRegistry:
 
     def __init__(self):
         self._processors: dict[str, type[BaseProcessor]] = {}
+        # Processor names indexed by every BaseProcessor subclass they inherit
+        self._by_base: dict[type, list[str]] = {}
 
     def register(self, name: str, processor_class: type[BaseProcessor]) -> None:
         """Register a processor implementation.
@@ -128,7 +199,15 @@ class ProcessorRegistry:
             name: Unique name for the processor.
             processor_class: Processor class.
         """
+        if name in self._processors:
+            for names in self._by_base.values():
+                if name in names:
+                    names.remove(name)
+
         self._processors[name] = processor_class
+        for base in processor_class.__mro__:
+            if issubclass(base, BaseProcessor):
+                self._by_base.setdefault(base, []).append(name)
         logger.debug(f"Registered processor: {name}")
 
     def register_decorator(self, name: str):
@@ -189,15 +268,7 @@ class ProcessorRegistry:
         Returns:
             List of processor names whose classes inherit from base_class.
         """
-        results: list[str] = []
-        for name, cls in self._processors.items():
-            try:
-                if issubclass(cls, base_class):
-                    results.append(name)
-            except Exception:
-                # Be defensive if a non-class somehow got registered
-                continue
-        return results
+        return list(self._by_base.get(base_class, ()))
 
     def get_processor_classes(self) -> dict[str, type[BaseProcessor]]:
         """Expose a copy of the registry mapping name -> class.
@@ -15,6 +15,30 @@ from cream.core.config import config
 
 logger = get_logger()
 
+# Shared console that only outputs to terminal (not log files). `stderr=True`
+# looks up sys.stderr on each write, so later redirects are followed.
+_CONSOLE = Console(stderr=True, force_terminal=True)
+
+
+class _DummyProgress:
+    """No-op stand-in for Progress when progress bars are disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def add_task(self, *_args, **_kwargs):
+        return 0
+
+    def update(self, *_args, **_kwargs):
+        return None
+
+
+# Stateless, so one instance serves every caller
+_DUMMY_PROGRESS = _DummyProgress()
+
 
 def create_progress(worker_id: int | None = None) -> Progress:
     """Create a progress bar with real-time processing count.
@@ -42,26 +66,9 @@ def create_progress(worker_id: int | None = None) -> Progress:
     else:
         description = "[bold blue]{task.description}"
 
-    # Allow disabling via global config
-    if not getattr(config, "enable_progress_bars", True):
-
-        class _DummyProgress:
-            def __enter__(self):
-                return self
-
-            def __exit__(self, exc_type, exc, tb):
-                return False
-
-            def add_task(self, *_args, **_kwargs):
-                return 0
-
-            def update(self, *_args, **_kwargs):
-                return None
-
-        return _DummyProgress()  # type: ignore[return-value]
-
-    # Create console that only outputs to terminal (not log files)
-    console = Console(file=sys.stderr, force_terminal=True)
+    # Allow disabling via global config; skip drawing when stderr is redirected
+    if not config.enable_progress_bars or not sys.stderr.isatty():
+        return _DUMMY_PROGRESS  # type: ignore[return-value]
 
     return Progress(
         TextColumn(description),
@@ -69,7 +76,7 @@ def create_progress(worker_id: int | None = None) -> Progress:
         MofNCompleteColumn(),  # Shows "25/100" format
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TimeRemainingColumn(),
-        console=console,
+        console=_CONSOLE,
     )
 
 
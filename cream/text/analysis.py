@@ -1,57 +1,121 @@
 """Text analysis processor templates."""
 
+import json
 import re
 import subprocess
+from array import array
+from contextlib import nullcontext
 from pathlib import Path
 
-from cream.core.processor import register_processor
-from cream.text.text_processor import BaseTextProcessor
+from cream.core.plotting import print_histogram, uplot_histogram
+from cream.core.processor import as_bool, register_processor
+from cream.text.text_processor import BaseTextProcessor, iter_lines, open_text
 from cream.core.exceptions import TextProcessingError
 from cream.core.logging import get_logger
 
 logger = get_logger()
 
+_TOKEN_RE = re.compile(r"[\u4e00-\u9fff]|[A-Za-z0-9]+")
+# One pass yields every per-line statistic: each CJK character or ASCII
+# alphanumeric run is a word, and other decimal digits (e.g. full-width)
+# only flag has_digit.
+_SCAN_RE = re.compile(r"(?P<zh>[\u4e00-\u9fff])|(?P<tok>[A-Za-z0-9]+)|(?P<dig>\d)")
+
+
+# Bits of the flags collected by `_scan`
+_HAS_ZH, _HAS_EN, _HAS_DIGIT = 1, 2, 4
+_ALL_FLAGS = _HAS_ZH | _HAS_EN | _HAS_DIGIT
+# Flags set by a match, indexed by its group number (zh, tok, dig)
+_GROUP_FLAGS = (0, _HAS_ZH, 0, _HAS_DIGIT)
+
+
+def _scan(text: str) -> tuple[int, bool, bool, bool]:
+    """Return (word_count, has_digit, has_zh, has_en) from a single scan."""
+    words = 0
+    flags = 0
+    for m in _SCAN_RE.finditer(text):
+        group = m.lastindex
+        if group == 2:
+            words += 1
+            tok = m.group(2)
+            if not tok.isdigit():
+                flags |= _HAS_EN
+            if not tok.isalpha():
+                flags |= _HAS_DIGIT
+        else:
+            words += group == 1
+            flags |= _GROUP_FLAGS[group]
+        if flags == _ALL_FLAGS:
+            # Every flag is known; count the remaining words in C
+            words += len(_TOKEN_RE.findall(text, m.end()))
+            break
+    return (
+        words,
+        bool(flags & _HAS_DIGIT),
+        bool(flags & _HAS_ZH),
+        bool(flags & _HAS_EN),
+    )
+
 
 @register_processor("text_metaviewer")
 class TextMetaViewer(BaseTextProcessor):
+    """Show per-line text statistics and a word count histogram.
+
+    Records are written as JSON lines to the output path, with a `.jsonl`
+    suffix, when one is given. The histogram is drawn in-process;
+    `external_hist=true` draws it with youplot (`uplot`) instead.
+    """
+
     @staticmethod
     def word_count(text: str) -> int:
-        tokens = re.findall(r"[\u4e00-\u9fff]|[A-Za-z0-9]+", text)
-        return len(tokens)
+        return len(_TOKEN_RE.findall(text))
 
     def process_single(
         self, input_path: Path, output_path: Path | None = None, **kwargs
     ) -> dict[str, int | float]:
         self.validate_input(input_path)
 
-        meta_info = []
-        with input_path.open("r", encoding="utf-8") as fin:
-            for line in fin:
+        # Keep only the word counts in memory; per-line records go straight
+        # to a `.jsonl` file when an output path is given. The suffix keeps
+        # records from being picked up as text input by later runs.
+        if output_path is not None:
+            output_path = output_path.with_suffix(".jsonl")
+            if output_path.resolve() == input_path.resolve():
+                error_message = f"Output would overwrite the input: {input_path}"
+                logger.error(error_message)
+                raise TextProcessingError(error_message)
+        lengths = array("i")
+        with (
+            open_text(output_path, "w")
+            if output_path is not None
+            else nullcontext() as fout
+        ):
+            for line in iter_lines(input_path):
                 text = line.strip()
-                meta_info.append(
-                    # Add more info you want
-                    {
+                word_count, has_digit, has_zh, has_en = _scan(text)
+                lengths.append(word_count)
+                if fout is not None:
+                    record = {
+                        # Add more info you want
                         "text": text,
                         "str_length": len(text),
-                        "word_count": self.word_count(text),
-                        "has_digit": any(ch.isdigit() for ch in text),
-                        "has_zh": bool(re.search(r"[\u4e00-\u9fff]", text)),
-                        "has_en": bool(re.search(r"[A-Za-z]", text)),
+                        "word_count": word_count,
+                        "has_digit": has_digit,
+                        "has_zh": has_zh,
+                        "has_en": has_en,
                     }
-                )
+                    fout.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        # Print length distribution, with youplot only when requested
+        if not as_bool(kwargs.get("external_hist", False)):
+            print_histogram(lengths, title="Word count")
+            return len(lengths)
 
-        # Print length distribution with youplot
-        lengths = [r["word_count"] for r in meta_info]
         try:
-            subprocess.run(
-                ["uplot", "hist"],
-                input="\n".join(map(str, lengths)),
-                text=True,
-                check=True,
-            )
+            uplot_histogram(lengths)
         except subprocess.CalledProcessError as e:
             error_message = f"Command failed: {e}\nstdout: {e.stdout or ''}\nstderr: {e.stderr or ''}"
             logger.error(error_message)
             raise TextProcessingError(error_message) from e
 
-        return len(meta_info)
+        return len(lengths)
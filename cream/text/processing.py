@@ -1,14 +1,18 @@
 """Text processing templates - normalization and other processing operations."""
 
+from itertools import islice
 from pathlib import Path
 
 from cream.core.processor import register_processor, ModelBackedProcessor
-from cream.text.text_processor import BaseTextProcessor
+from cream.text.text_processor import BaseTextProcessor, iter_lines, open_text
 from cream.core.exceptions import TextProcessingError
 from cream.core.logging import get_logger
 
 logger = get_logger()
 
+# Lines normalized and written per writelines call
+_LINE_CHUNK_SIZE = 10_000
+
 
 @register_processor("text_normalizer")
 class TextNormalizer(ModelBackedProcessor, BaseTextProcessor):
@@ -37,11 +41,10 @@ class TextNormalizer(ModelBackedProcessor, BaseTextProcessor):
         output_path = output_path or input_path
 
         # Each line is considered a separate text
-        with (
-            input_path.open("r", encoding="utf-8") as fin,
-            output_path.open("w", encoding="utf-8") as fout,
-        ):
-            for line in fin:
-                fout.write(self.model.normalize(line.strip()) + "\n")
+        lines = iter_lines(input_path)
+        with open_text(output_path, "w") as fout:
+            normalize = self.model.normalize
+            while chunk := list(islice(lines, _LINE_CHUNK_SIZE)):
+                fout.writelines([normalize(line.strip()) + "\n" for line in chunk])
 
         return output_path
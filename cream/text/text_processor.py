@@ -1,5 +1,7 @@
 """Unified text processor interface."""
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 from cream.core.processor import BaseProcessor, processor_registry
@@ -9,14 +11,59 @@ from cream.core.config import config
 
 logger = get_logger()
 
+# Characters decoded per read in `iter_lines`
+_READ_BLOCK_CHARS = 8 * 1024 * 1024
+
+# Binary buffer size for text files, well above io's 8 KiB default
+_IO_BUFFER_SIZE = 1 << 20
+
+
+def open_text(path: Path, mode: str = "r"):
+    """Open a UTF-8 text file with a 1 MiB buffer.
+
+    Args:
+        path: Path to the text file.
+        mode: Text mode to open the file in (e.g. "r" or "w").
+    """
+    return open(os.fspath(path), mode, encoding="utf-8", buffering=_IO_BUFFER_SIZE)
+
+
+def iter_lines(input_path: Path, block_chars: int = _READ_BLOCK_CHARS) -> Iterator[str]:
+    """Yield the lines of a UTF-8 text file, without line endings.
+
+    Decodes large blocks and splits each with one `str.split` instead of
+    iterating the file line by line, while keeping memory bounded.
+
+    Args:
+        input_path: Path to the text file.
+        block_chars: Number of characters to read per block.
+    """
+    with open_text(input_path) as fin:
+        # Pieces of the unfinished last line, joined once its end arrives so
+        # a line spanning many blocks is copied only once
+        pending: list[str] = []
+        while block := fin.read(block_chars):
+            # Universal newlines already turned "\r\n" and "\r" into "\n"
+            lines = block.split("\n")
+            if len(lines) == 1:
+                pending.append(block)
+                continue
+            if pending:
+                pending.append(lines[0])
+                lines[0] = "".join(pending)
+            pending = [lines.pop()]
+            yield from lines
+        if tail := "".join(pending):
+            yield tail
+
 
 class BaseTextProcessor(BaseProcessor):
     """Base class for text processors."""
 
     @property
-    def SUPPORTED_FORMATS(self):
+    def SUPPORTED_FORMATS(self) -> frozenset[str]:
         """Get supported text formats from config."""
-        return set(config.text_formats)
+        return config.text_format_set
 
     def validate_input(self, input_path: Path) -> None:
         """Validate text input file."""